@@ -15,6 +15,76 @@ import tkinter as tk
 import math
 import platform
 
+import numpy as np
+
+# Rotation de 60° appliquée au tiers de segment pour former la pointe du motif
+COS60 = 0.5
+SIN60 = math.sqrt(3) / 2
+
+# Vecteurs unitaires des 6 caps possibles d'un segment (multiples de 60°)
+_DIRECTIONS = np.array([
+    (1, 0), (COS60, SIN60), (-COS60, SIN60),
+    (-1, 0), (-COS60, -SIN60), (COS60, -SIN60),
+], dtype=np.float32)
+
+# Cap du premier côté du triangle de base, du sommet supérieur vers le sommet inférieur gauche (120°)
+_CAP_INITIAL = 2
+
+# Rotations de -120° et -240° (matrices pour des vecteurs lignes) donnant les deux autres côtés
+_ROTATIONS_COTES = np.array([
+    [[-COS60, -SIN60], [SIN60, -COS60]],
+    [[-COS60, SIN60], [-SIN60, -COS60]],
+], dtype=np.float32)
+
+# Cap relatif des 4 sous-segments du motif par rapport au segment remplacé, en multiples de 60°
+_CAPS_MOTIF = np.array([0, 1, -1, 0], dtype=np.intp)
+
+
+def _caps_segments(niveau, cap):
+    """
+    Calcule directement le cap de chacun des 4**niveau segments d'un côté.
+    Chaque chiffre en base 4 de l'indice d'un segment désigne le sous-segment du motif
+    choisi à un niveau de récursion, et le cap du segment est la somme des caps relatifs
+    correspondants: la boucle ne porte que sur les niveaux, jamais sur les segments.
+
+    Args:
+        niveau: Niveau de récursion du côté
+        cap: Cap du côté entier, en multiples de 60°
+
+    Returns:
+        np.ndarray: Caps des segments, entre 0 et 5
+    """
+    indices = np.arange(4**niveau)
+    caps = np.full(4**niveau, cap, dtype=np.intp)
+    for chiffre in range(niveau):
+        caps += _CAPS_MOTIF[(indices >> 2*chiffre) & 3]
+    return caps % 6
+
+
+def _koch_fill(points, offset, caps, pas):
+    """
+    Trace un côté du flocon directement dans un tableau préalloué.
+    Chaque point est la somme cumulée des pas effectués selon les caps des segments:
+    aucune trigonométrie ni récursion.
+
+    Args:
+        points (np.ndarray): Tableau (N, 2) dont la ligne offset contient le point de départ
+        offset: Indice du point de départ dans points
+        caps (np.ndarray): Caps des segments du côté, en multiples de 60°
+        pas: Longueur d'un segment
+
+    Returns:
+        int: Indice du dernier point écrit, point de départ du côté suivant
+    """
+    fin = offset + len(caps)
+    
+    # Les pas sont cumulés en float64 pour éviter la dérive d'arrondi, puis stockés en float32
+    cote = points[offset + 1:fin + 1]
+    cote[:] = np.cumsum((_DIRECTIONS * np.float32(pas))[caps], axis=0, dtype=np.float64)
+    cote += points[offset]
+    return fin
+
+
 class VonKochApp:
     """
     Application principale pour visualiser le flocon de Von Koch.
@@ -22,10 +92,12 @@ class VonKochApp:
     Attributes:
         TAILLE_FLOCON (int): Taille de base du flocon en pixels
         NIVEAU_RECURSION (int): Niveau de récursion initial du flocon (plus le niveau est élevé, plus le flocon est détaillé)
+        TAILLE_SEGMENT_MIN (float): Longueur minimale à l'écran, en pixels, des plus petits segments dessinés
     """
     
     TAILLE_FLOCON = 600
     NIVEAU_RECURSION = 4
+    TAILLE_SEGMENT_MIN = 1.0
     
     def __init__(self, root):
         """
@@ -43,6 +115,10 @@ class VonKochApp:
         self.canvas = tk.Canvas(root, width=self.canvas_width, height=self.canvas_height, bg="grey")
         self.canvas.pack(fill=tk.BOTH, expand=True)
         
+        # Contour du flocon, tracé en une seule ligne créée une fois puis mise à jour via ses coordonnées.
+        # Les extrémités arrondies referment la ligne au sommet comme la jointure arrondie d'un polygone
+        self._ligne_id = self.canvas.create_line(0, 0, 0, 0, fill="white", width=2, capstyle=tk.ROUND)
+        
         # Variables pour gérer le zoom et le déplacement
         self.zoom = 1.0
         self.pan_x = 0
@@ -51,8 +127,14 @@ class VonKochApp:
         self.last_x = 0
         self.last_y = 0
         
+        # Indique qu'un redessin est déjà planifié, pour regrouper les événements rapprochés
+        self._redessin_en_attente = False
+        
         self.niveau = self.NIVEAU_RECURSION
         
+        # Cache des points du flocon par niveau, en coordonnées unitaires (côté 1, centré sur l'origine)
+        self._koch_cache = {}
+        
         # Détection du système d'exploitation pour adapter les contrôles
         self.os = platform.system()
         
@@ -73,14 +155,14 @@ class VonKochApp:
         self.canvas.bind("<B1-Motion>", self.deplacer)
         self.canvas.bind("<ButtonRelease-1>", self.arreter_deplacement)
         
-        # Configuration des événements de zoom selon le système d'exploitation
-        if self.os == "Windows":
-            self.canvas.bind("<MouseWheel>", self.zoomer_windows)
-        elif self.os == "Darwin":
-            self.canvas.bind("<MouseWheel>", self.zoomer_macos)
+        # Configuration des événements de zoom selon le système d'exploitation,
+        # avec un gestionnaire choisi une seule fois plutôt qu'à chaque événement
+        self._gestionnaire_molette = self._creer_gestionnaire_molette(self.os)
+        if self.os in ("Windows", "Darwin"):
+            self.canvas.bind("<MouseWheel>", self._gestionnaire_molette)
         else:
-            self.canvas.bind("<Button-4>", self.zoomer_in_linux)
-            self.canvas.bind("<Button-5>", self.zoomer_out_linux)
+            self.canvas.bind("<Button-4>", self._gestionnaire_molette)
+            self.canvas.bind("<Button-5>", self._gestionnaire_molette)
         
         # Raccourcis clavier pour le zoom
         self.root.bind("<plus>", lambda e: self.zoomer_clavier(True))
@@ -112,93 +194,80 @@ class VonKochApp:
         niveau_up_btn = tk.Button(niveau_frame, text="Niveau +", command=lambda: self.changer_niveau(1))
         niveau_up_btn.pack(side=tk.LEFT, padx=5)
     
-    def calculer_points_koch(self, x1, y1, x2, y2, niveau):
+    def calculer_points_koch(self, niveau):
         """
-        Calcule récursivement les points formant le motif de Von Koch.
-        Pour chaque segment, crée 4 nouveaux segments formant une pointe.
+        Calcule les points du flocon de côté 1 centré sur l'origine, à partir
+        des caps de ses segments calculés directement par _caps_segments.
 
         Args:
-            x1, y1: Coordonnées du point de départ
-            x2, y2: Coordonnées du point d'arrivée
-            niveau: Niveau de récursion actuel
+            niveau: Niveau de récursion du flocon
 
         Returns:
-            list: Liste des points [(x,y)] formant le motif
+            np.ndarray: Tableau (3 * 4**niveau + 1, 2) en float32 des points du flocon,
+            refermé sur le premier point
         """
-        if niveau == 0:
-            return [(x1, y1), (x2, y2)]
-        
-        # Calcul du vecteur directeur et de sa longueur
-        dx = x2 - x1
-        dy = y2 - y1
-        distance = math.sqrt(dx*dx + dy*dy)
-        angle = math.atan2(dy, dx)
-        
-        # Calcul des points du motif de Koch
-        p1_x = x1 + dx/3
-        p1_y = y1 + dy/3
-        
-        p3_x = x1 + 2*dx/3
-        p3_y = y1 + 2*dy/3
-        
-        # Point formant la pointe (rotation de 60° par rapport au segment)
-        p2_x = p1_x + distance/3 * math.cos(angle + math.pi/3)
-        p2_y = p1_y + distance/3 * math.sin(angle + math.pi/3)
-        
-        # Appels récursifs pour chaque nouveau segment
-        segment1 = self.calculer_points_koch(x1, y1, p1_x, p1_y, niveau-1)
-        segment2 = self.calculer_points_koch(p1_x, p1_y, p2_x, p2_y, niveau-1)
-        segment3 = self.calculer_points_koch(p2_x, p2_y, p3_x, p3_y, niveau-1)
-        segment4 = self.calculer_points_koch(p3_x, p3_y, x2, y2, niveau-1)
-        
-        # Combine les segments en évitant les points en double
-        result = segment1[:-1] + segment2[:-1] + segment3[:-1] + segment4
-        
-        return result
+        # Calcule les dimensions du triangle équilatéral de base
+        hauteur = math.sqrt(3) / 2
+        
+        # Un seul tableau contigu "xyxy..." reçoit les trois côtés, sans copie intermédiaire
+        points = np.empty((3 * 4**niveau + 1, 2), dtype=np.float32)
+        
+        # Seul le premier côté est tracé, depuis le sommet supérieur
+        points[0] = (0, -hauteur/2)
+        n = _koch_fill(points, 0, _caps_segments(niveau, _CAP_INITIAL), 1 / 3**niveau)
+        
+        # Les deux autres côtés s'obtiennent par rotation du premier autour du centre de gravité
+        centre = np.array([0, hauteur/6], dtype=np.float32)
+        cote = points[:n] - centre
+        for i, rotation in enumerate(_ROTATIONS_COTES, start=1):
+            np.matmul(cote, rotation, out=points[i*n:(i+1)*n])
+            points[i*n:(i+1)*n] += centre
+        points[-1] = points[0]
+        return points
     
     def dessiner_flocon(self):
         """Dessine le flocon complet sur le canvas avec les paramètres actuels."""
-        self.canvas.delete("all")
-        
         taille = self.TAILLE_FLOCON * self.zoom
         
-        # Calcule le centre de la vue en tenant compte du déplacement
-        centre_x = self.canvas_width / 2 + self.pan_x
-        centre_y = self.canvas_height / 2 + self.pan_y
+        # Niveau de détail: les niveaux dont les segments seraient plus petits qu'un pixel sont ignorés
+        niveau_eff = self.niveau
+        while niveau_eff > 0 and taille / 3**niveau_eff < self.TAILLE_SEGMENT_MIN:
+            niveau_eff -= 1
         
-        # Calcule les dimensions du triangle équilatéral de base
-        hauteur = taille * math.sqrt(3) / 2
-        
-        # Calcule les trois sommets du triangle
-        x1 = centre_x
-        y1 = centre_y - hauteur/2
-        
-        x2 = centre_x - taille/2
-        y2 = centre_y + hauteur/2
-        
-        x3 = centre_x + taille/2
-        y3 = centre_y + hauteur/2
+        # La géométrie de chaque niveau n'est calculée qu'une seule fois
+        points_unitaires = self._koch_cache.get(niveau_eff)
+        if points_unitaires is None:
+            points_unitaires = self.calculer_points_koch(niveau_eff)
+            self._koch_cache[niveau_eff] = points_unitaires
         
-        # Calcule les points pour chaque côté du triangle
-        points_cote1 = self.calculer_points_koch(x1, y1, x2, y2, self.niveau)
-        points_cote2 = self.calculer_points_koch(x2, y2, x3, y3, self.niveau)
-        points_cote3 = self.calculer_points_koch(x3, y3, x1, y1, self.niveau)
+        # Le zoom et le déplacement se réduisent à une transformation affine des points en cache,
+        # calculée en float32 puisque le canvas travaille au pixel près
+        centre = np.array([self.canvas_width / 2 + self.pan_x, self.canvas_height / 2 + self.pan_y],
+                          dtype=np.float32)
+        points = points_unitaires * np.float32(taille)
+        points += centre
         
-        # Combine tous les points en évitant les doublons
-        tous_points = []
-        tous_points.extend(points_cote1[:-1])
-        tous_points.extend(points_cote2[:-1])
-        tous_points.extend(points_cote3[:-1])
-        
-        # Convertit la liste de points en liste plate pour create_polygon
-        points_plats = [coord for point in tous_points for coord in point]
-        
-        # Dessine le flocon
-        self.canvas.create_polygon(points_plats, outline="white", fill="", width=2)
+        # Met à jour la ligne existante plutôt que d'en recréer une
+        self.canvas.coords(self._ligne_id, points.ravel().tolist())
         
         # Met à jour l'affichage du zoom
         self.info_zoom.config(text=f"Zoom: {self.zoom:.2f}x")
     
+    def _demander_redessin(self):
+        """
+        Planifie un redessin du flocon lorsque Tkinter redevient inactif.
+        Les demandes reçues alors qu'un redessin est déjà planifié sont ignorées,
+        ce qui limite le nombre de redessins lors des déplacements et des zooms rapides.
+        """
+        if not self._redessin_en_attente:
+            self._redessin_en_attente = True
+            self.root.after_idle(self._executer_redessin)
+    
+    def _executer_redessin(self):
+        """Exécute le redessin planifié par _demander_redessin."""
+        self._redessin_en_attente = False
+        self.dessiner_flocon()
+    
     def commencer_deplacement(self, event):
         """Initialise le déplacement du flocon."""
         self.dragging = True
@@ -220,38 +289,39 @@ class VonKochApp:
             self.last_x = event.x
             self.last_y = event.y
             
-            # Redessine le flocon
-            self.dessiner_flocon()
+            # Planifie le redessin du flocon
+            self._demander_redessin()
     
     def arreter_deplacement(self, event):
         """Termine le déplacement du flocon."""
         self.dragging = False
     
-    def zoomer_windows(self, event):
-        """Gère le zoom sur Windows."""
-        factor = 1.0 + (event.delta / 1200.0)
-        self.zoom *= factor
-        self.zoom = max(0.1, min(50.0, self.zoom))
-        self.dessiner_flocon()
-    
-    def zoomer_macos(self, event):
-        """Gère le zoom sur macOS."""
-        factor = 1.0 + (event.delta / 120.0)
-        self.zoom *= factor
-        self.zoom = max(0.1, min(50.0, self.zoom))
-        self.dessiner_flocon()
-    
-    def zoomer_in_linux(self, event):
-        """Gère le zoom avant sur Linux."""
-        self.zoom *= 1.1
-        self.zoom = min(50.0, self.zoom)
-        self.dessiner_flocon()
-    
-    def zoomer_out_linux(self, event):
-        """Gère le zoom arrière sur Linux."""
-        self.zoom /= 1.1
-        self.zoom = max(0.1, self.zoom)
-        self.dessiner_flocon()
+    def _creer_gestionnaire_molette(self, systeme):
+        """
+        Crée le gestionnaire de zoom à la molette adapté au système d'exploitation.
+
+        Args:
+            systeme (str): Nom du système renvoyé par platform.system()
+
+        Returns:
+            function: Gestionnaire d'événement Tkinter appliquant le zoom
+        """
+        if systeme in ("Windows", "Darwin"):
+            # Windows renvoie des multiples de 120 par cran de molette, macOS des valeurs plus faibles
+            diviseur = 1200.0 if systeme == "Windows" else 120.0
+            
+            def zoomer_molette(event):
+                self.zoom = max(0.1, min(50.0, self.zoom * (1.0 + event.delta / diviseur)))
+                self._demander_redessin()
+        else:
+            # Sous Linux, la molette génère les boutons 4 (zoom avant) et 5 (zoom arrière)
+            facteurs = {4: 1.1, 5: 1 / 1.1}
+            
+            def zoomer_molette(event):
+                self.zoom = max(0.1, min(50.0, self.zoom * facteurs[event.num]))
+                self._demander_redessin()
+        
+        return zoomer_molette
     
     def zoomer_clavier(self, zoom_in):
         """
@@ -266,7 +336,7 @@ class VonKochApp:
             self.zoom /= 1.2
         
         self.zoom = max(0.1, min(50.0, self.zoom))
-        self.dessiner_flocon()
+        self._demander_redessin()
         
     def changer_niveau(self, delta):
         """